@@ -0,0 +1,109 @@
+# ============================================================
+# 역할/콘텐츠 타입 × 키워드 연관 행렬 (sparse)
+# - 문서×단어 이진 행렬 X(CSR)를 데이터셋당 한 번만 만든다(디스크 캐시 번들에 포함)
+# - 그룹 one-hot 행렬 G와의 곱 Gᵀ·X = 그룹별 키워드 문서 수 → 코퍼스 재토큰화 없음
+# - 필터 결과는 마스크 밖 문서를 Gᵀ에서 빼는 것으로 처리(X는 그대로)
+# - 점수: count / lift / PMI
+# ============================================================
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from core import ROLE_NAMES, build_tokens
+from tokenizer import TokenIndex
+
+
+MIN_DF = 3          # 이보다 적은 문서에 나온 단어는 어휘에서 제외(노이즈/메모리)
+MAX_TERMS = 3000    # 어휘 상한(문서 빈도 상위)
+MIN_COUNT = 3       # lift/PMI는 표본이 작으면 튀므로 이 이상 공출현만 점수화
+
+SCORES = {"count": "문서 수", "lift": "Lift", "pmi": "PMI"}
+GROUPS = {
+    "role": ROLE_NAMES,
+    "content_type": ["news", "paper", "job"],
+}
+
+
+# -------------------------------
+# Build (once per dataset)
+# -------------------------------
+def build_doc_term(tokens: TokenIndex, min_df: int = MIN_DF, max_terms: int = MAX_TERMS) -> dict:
+    # TokenIndex(문서별 토큰 id) → 이진 문서×단어 행렬. 같은 문서 안의 반복은 1로 센다
+    X = sp.csr_matrix(
+        (np.ones(len(tokens.ids), dtype=np.float32), tokens.ids, tokens.indptr),
+        shape=(len(tokens), len(tokens.vocab)),
+        copy=True,   # sum_duplicates가 indices를 제자리 수정 → TokenIndex 배열 보호
+    )
+    X.sum_duplicates()
+    X.data[:] = 1
+    dfreq = np.diff(X.tocsc().indptr)                          # 단어별 문서 수
+    order = np.argsort(-dfreq, kind="stable")[:max_terms]
+    cols = order[dfreq[order] >= min_df]
+    return {"X": X[:, cols].tocsr(), "vocab": np.asarray(tokens.vocab, dtype=object)[cols]}
+
+
+def group_codes(labels, categories: list) -> np.ndarray:
+    # 라벨 → 그룹 번호(categories에 없으면 -1)
+    return pd.Categorical(labels, categories=categories).codes.astype(np.int32)
+
+
+def build_index(df: pd.DataFrame, tokens: TokenIndex = None, **kwargs) -> dict:
+    # 문서×단어 행렬 + GROUPS별 그룹 번호(라벨 범주화도 요청마다 하지 않도록 미리)
+    index = build_doc_term(tokens if tokens is not None else build_tokens(df), **kwargs)
+    index["codes"] = {g: group_codes(df[g], cats) for g, cats in GROUPS.items()}
+    return index
+
+
+def group_matrix(codes: np.ndarray, n_groups: int, mask=None) -> sp.csr_matrix:
+    # one-hot의 전치(그룹×문서). 마스크 밖 문서는 열을 비워 둔다
+    keep = codes >= 0
+    if mask is not None:
+        keep &= np.asarray(mask, dtype=bool)
+    cols = np.flatnonzero(keep)
+    return sp.csr_matrix(
+        (np.ones(len(cols), dtype=np.float32), (codes[cols], cols)),
+        shape=(n_groups, len(codes)),
+    )
+
+
+# -------------------------------
+# Association
+# -------------------------------
+def association(index: dict, group: str, mask=None, score: str = "lift",
+                top_k: int = 12, min_count: int = MIN_COUNT) -> pd.DataFrame:
+    # 반환: 그룹(행) × 키워드(열) 점수표. 열 = 그룹별 상위 top_k 키워드의 합집합
+    categories = GROUPS[group]
+    X = index["X"]
+    GT = group_matrix(index["codes"][group], len(categories), mask)
+
+    counts = (GT @ X).toarray()                                # 그룹 × 단어 공출현 문서 수
+    w = np.ones(X.shape[0], dtype=np.float32) if mask is None else np.asarray(mask, dtype=np.float32)
+    n_docs = w.sum()
+    n_group = np.asarray(GT.sum(axis=1)).ravel()               # 그룹별 문서 수
+    n_term = np.asarray(w @ X).ravel()                         # 단어별 문서 수
+
+    if score == "count":
+        scores = counts
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lift = counts * n_docs / np.outer(n_group, n_term)
+        lift[(counts < min_count) | ~np.isfinite(lift)] = np.nan
+        scores = np.log2(lift) if score == "pmi" else lift
+
+    # 그룹마다 상위 top_k 키워드 → 열 합집합(순서: 첫 등장 그룹 기준)
+    cols = []
+    ranked = np.where(np.isnan(scores), -np.inf, scores)
+    for g in range(len(categories)):
+        if n_group[g] == 0:
+            continue
+        best = np.argsort(-ranked[g], kind="stable")[:top_k]
+        cols.extend(j for j in best if np.isfinite(ranked[g, j]) and counts[g, j] > 0)
+    cols = list(dict.fromkeys(cols))
+
+    keep = n_group > 0
+    return pd.DataFrame(
+        scores[np.ix_(keep, cols)] if cols else np.empty((int(keep.sum()), 0)),
+        index=[c for c, k in zip(categories, keep) if k],
+        columns=index["vocab"][cols].tolist() if cols else [],
+    )
@@ -0,0 +1,354 @@
+# ============================================================
+# 공용 상수/데이터 정규화 (Streamlit 비의존)
+# - main.py(앱)와 오프라인 스크립트(enrich.py 등)가 같은 규칙을 쓰도록 분리
+# ============================================================
+
+import os
+import re
+import json
+import pickle
+import hashlib
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from tokenizer import TOKENIZER_NAME, TokenIndex, get_tokenizer
+
+
+# -------------------------------
+# Constants
+# -------------------------------
+DEFAULT_PATH = "AI_Agents_Ecosystem_2026.csv"
+DATA_PATH = os.getenv("AI_AGENT_CSV_PATH", DEFAULT_PATH)
+
+# LLM 보강 결과(요약/역할 제안) 캐시 — enrich.py가 쓰고 앱은 읽기만 한다
+ENRICH_CACHE_PATH = os.getenv("AI_AGENT_ENRICH_PATH", "enrichments.jsonl")
+
+# 정규화/집계가 끝난 데이터셋 디스크 캐시 — warmup.py가 미리 만들고 앱은 읽기만 한다
+CACHE_DIR = os.getenv("AI_AGENT_CACHE_DIR", ".cache")
+PREPARED_VERSION = 4   # normalize_frame/집계 규칙이 바뀌면 올린다(옛 캐시 무효화)
+
+ROLE_DEFS = [
+    ("설계자(기획/구조화/오케스트레이션)", [
+        r"\borchestrat", r"\bworkflow", r"\bpipeline", r"\bplanner", r"\bplanning",
+        r"\barchitecture", r"\bdesign", r"\brouter", r"\bcoordinator", r"\bprompt\s*design"
+    ]),
+    ("구현자(개발/자동화)", [
+        r"\bimplement", r"\bimplementation", r"\bbuild", r"\bdev", r"\bdeveloper",
+        r"\bcode", r"\blibrary", r"\bsdk\b", r"\bapi\b", r"\bintegration", r"\bplugin",
+        r"\bgithub\b", r"\btypescript\b", r"\bpython\b", r"\bnode\b"
+    ]),
+    ("운영자(배포/모니터링/MLOps)", [
+        r"\bdeploy", r"\bdeployment", r"\bops\b", r"\bmlops\b", r"\bmonitor",
+        r"\bobservability", r"\bproduction", r"\breliability", r"\binfra", r"\bkubernetes",
+        r"\bserver", r"\bscaling", r"\blatency"
+    ]),
+    ("분석가(리서치/데이터)", [
+        r"\barxiv\b", r"\bpaper\b", r"\bstudy\b", r"\bdata\b", r"\bdataset\b",
+        r"\bstat", r"\bempirical", r"\bexperiment", r"\bmethodology", r"\btheory",
+        r"\bsurvey\b"
+    ]),
+    ("평가자(Eval/검증/안전)", [
+        r"\beval", r"\bevaluation", r"\bbenchmark", r"\btest", r"\btesting",
+        r"\bverification", r"\bvalidat", r"\bsafety", r"\balignment", r"\brisk",
+        r"\bguardrail", r"\bpolicy"
+    ]),
+    ("커뮤니케이터(교육/PM/번역)", [
+        r"\bguide\b", r"\btutorial", r"\bexplainer", r"\bdocument", r"\bdocumentation",
+        r"\bcommunity", r"\bproduct", r"\bpm\b", r"\bteaching", r"\bcourse", r"\bwriting"
+    ]),
+]
+ROLE_NAMES = [r[0] for r in ROLE_DEFS]
+
+SKILL_TECH = ["Python", "API/연동", "데이터 처리", "LLM/RAG", "에이전트/워크플로우", "클라우드/배포", "보안/윤리"]
+SKILL_COG  = ["문제정의", "구조화", "실험/검증", "논리적 글쓰기", "모델링/추론", "정보탐색", "시스템 사고"]
+SKILL_ATT  = ["자기주도", "협업", "불확실성 감내", "학습 민첩성", "책임감", "사용자 관점", "끈기"]
+
+ROLE_TO_SKILLS = {
+    "설계자(기획/구조화/오케스트레이션)": {
+        "tech": ["API/연동", "에이전트/워크플로우", "LLM/RAG"],
+        "cog": ["문제정의", "구조화", "시스템 사고", "정보탐색"],
+        "att": ["사용자 관점", "협업", "학습 민첩성"]
+    },
+    "구현자(개발/자동화)": {
+        "tech": ["Python", "API/연동", "데이터 처리", "에이전트/워크플로우"],
+        "cog": ["구조화", "문제정의", "정보탐색"],
+        "att": ["자기주도", "끈기", "책임감"]
+    },
+    "운영자(배포/모니터링/MLOps)": {
+        "tech": ["클라우드/배포", "API/연동", "보안/윤리"],
+        "cog": ["시스템 사고", "실험/검증", "문제정의"],
+        "att": ["책임감", "불확실성 감내", "협업"]
+    },
+    "분석가(리서치/데이터)": {
+        "tech": ["데이터 처리", "Python", "LLM/RAG"],
+        "cog": ["실험/검증", "논리적 글쓰기", "정보탐색", "모델링/추론"],
+        "att": ["학습 민첩성", "끈기", "자기주도"]
+    },
+    "평가자(Eval/검증/안전)": {
+        "tech": ["보안/윤리", "데이터 처리", "LLM/RAG"],
+        "cog": ["실험/검증", "문제정의", "논리적 글쓰기"],
+        "att": ["책임감", "불확실성 감내", "사용자 관점"]
+    },
+    "커뮤니케이터(교육/PM/번역)": {
+        "tech": ["API/연동", "LLM/RAG"],
+        "cog": ["논리적 글쓰기", "문제정의", "정보탐색"],
+        "att": ["협업", "사용자 관점", "책임감"]
+    },
+}
+
+
+# -------------------------------
+# Loading / normalization
+# -------------------------------
+def read_csv_safely(path: str) -> pd.DataFrame:
+    # 인코딩 fallback (utf-8 → cp949 → latin1)
+    last_err = None
+    for enc in ("utf-8", "cp949", "latin1"):
+        try:
+            return pd.read_csv(path, encoding=enc)
+        except Exception as e:
+            last_err = e
+    raise last_err
+
+
+def classify_role(title: str, desc: str, source: str) -> str:
+    # role classification (rule-based)
+    text = f"{title} {desc} {source}".lower()
+    for role, patterns in ROLE_DEFS:
+        for p in patterns:
+            if re.search(p, text):
+                return role
+    # fallback: content type cues
+    if "arxiv" in text:
+        return "분석가(리서치/데이터)"
+    return "설계자(기획/구조화/오케스트레이션)"
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # 원본 CSV(Title, Source, Date, Description, Link) → 앱 내부 스키마
+    # normalize columns (case-insensitive)
+    cols = {c.strip().lower(): c for c in df.columns}
+    need = ["title", "source", "date", "description", "link"]
+    missing = [n for n in need if n not in cols]
+    if missing:
+        raise ValueError(f"CSV 컬럼이 예상과 다릅니다. 필요한 컬럼: {', '.join([n.title() for n in need])}")
+
+    df = df.rename(columns={
+        cols["title"]: "title",
+        cols["source"]: "source",
+        cols["date"]: "date",
+        cols["description"]: "desc",
+        cols["link"]: "link",
+    })
+
+    # sanitize types
+    for c in ["title", "source", "desc", "link"]:
+        df[c] = df[c].astype(str).fillna("").str.strip()
+
+    # parse date
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+
+    # domain
+    df["domain"] = df["link"].str.extract(r"https?://([^/]+)", expand=False).fillna("")
+
+    # content type (source-based)
+    s = df["source"].str.lower()
+    df["content_type"] = "news"
+    df.loc[s.str.contains("arxiv"), "content_type"] = "paper"
+    df.loc[s.str.contains("job"), "content_type"] = "job"
+
+    df["role"] = [classify_role(t, d, s) for t, d, s in zip(df["title"], df["desc"], df["source"])]
+
+    # drop empties + dedupe
+    df = df[(df["title"] != "") & (df["link"] != "")]
+    df = df.drop_duplicates(subset=["link"]).reset_index(drop=True)
+
+    # month/week for trends
+    if df["date"].notna().any():
+        df["month"] = df["date"].dt.to_period("M").astype(str)
+        df["week"] = df["date"].dt.to_period("W").astype(str)
+    else:
+        df["month"] = ""
+        df["week"] = ""
+
+    return df
+
+
+def apply_filters(df: pd.DataFrame, start_d=None, end_d=None, sources=None, types=None,
+                  domains=None, keyword: str = "") -> pd.DataFrame:
+    # 사이드바 필터와 같은 규칙. None = 해당 필터 미적용, domains는 비어 있으면 미적용
+    f = df
+    if (start_d or end_d) and f["date"].notna().any():
+        if start_d:
+            f = f[f["date"].dt.date >= start_d]
+        if end_d:
+            f = f[f["date"].dt.date <= end_d]
+    if sources is not None:
+        f = f[f["source"].isin(sources)]
+    if types is not None:
+        f = f[f["content_type"].isin(types)]
+    if domains:
+        f = f[f["domain"].isin(domains)]
+    if keyword and keyword.strip():
+        k = keyword.strip().lower()
+        f = f[f["title"].str.lower().str.contains(k, na=False) | f["desc"].str.lower().str.contains(k, na=False)]
+    return f.copy()
+
+
+# -------------------------------
+# Keywords
+# -------------------------------
+def corpus_texts(df: pd.DataFrame) -> list:
+    return (df["title"] + " " + df["desc"]).tolist()
+
+
+def build_tokens(df: pd.DataFrame) -> TokenIndex:
+    # 코퍼스 전체를 한 번에 토큰화(행 순서 = df 행 위치)
+    return TokenIndex.build(corpus_texts(df), get_tokenizer())
+
+
+def top_keywords(df: pd.DataFrame, n=25, tokens: TokenIndex = None):
+    # tokens: 전체 데이터셋의 TokenIndex(있으면 df.index 위치만 골라 재토큰화 없이 집계)
+    if tokens is None:
+        return build_tokens(df).most_common(n)
+    return tokens.most_common(n, mask=tokens.row_mask(df.index))
+
+
+def rising_keywords(df_all: pd.DataFrame, recent_days: int = 30, n=15, tokens: TokenIndex = None):
+    if not df_all["date"].notna().any():
+        return []
+
+    if tokens is None:
+        df_all = df_all.reset_index(drop=True)
+        tokens = build_tokens(df_all)
+
+    cutoff = pd.Timestamp(date.today() - timedelta(days=recent_days))
+    recent = df_all[df_all["date"] >= cutoff]
+    if len(recent) == 0:
+        return []
+
+    all_counts = tokens.counts(mask=tokens.row_mask(df_all.index))
+    recent_counts = tokens.counts(mask=tokens.row_mask(recent.index))
+
+    # score = recent frequency normalized - overall frequency normalized
+    all_total = all_counts.sum() or 1
+    recent_total = recent_counts.sum() or 1
+
+    scores = []
+    for j in np.flatnonzero(recent_counts):
+        rc, ac = int(recent_counts[j]), int(all_counts[j])
+        score = (rc / recent_total) - (ac / all_total)
+        scores.append((tokens.vocab[j], float(score), rc, ac))
+
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores[:n]
+
+
+# -------------------------------
+# LLM enrichment (read side)
+# -------------------------------
+def content_hash(title: str, desc: str) -> str:
+    # 같은 본문은 같은 키 → 한 번 보낸 항목은 다시 보내지 않는다
+    return hashlib.sha256(f"{title}\n{desc}".encode("utf-8")).hexdigest()[:32]
+
+
+def load_enrichments(path: str) -> dict:
+    # JSONL(한 줄 = 한 항목). 같은 키가 여러 번 나오면 마지막 값을 쓴다
+    out = {}
+    if not os.path.exists(path):
+        return out
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 중단된 쓰기 등으로 깨진 줄은 건너뜀
+            if rec.get("hash"):
+                out[rec["hash"]] = rec
+    return out
+
+
+def attach_enrichments(df: pd.DataFrame, enrich: dict) -> pd.DataFrame:
+    # 미리 계산된 결과만 붙인다(없으면 빈 문자열)
+    df = df.copy()
+    keys = [content_hash(t, d) for t, d in zip(df["title"], df["desc"])]
+    df["llm_summary"] = [enrich.get(k, {}).get("summary", "") for k in keys]
+    df["llm_role"] = [enrich.get(k, {}).get("role", "") for k in keys]
+    return df
+
+
+# -------------------------------
+# Prepared dataset (disk cache)
+# -------------------------------
+def _file_sig(path: str) -> str:
+    try:
+        s = os.stat(path)
+    except OSError:
+        return "-"
+    return f"{s.st_size}:{s.st_mtime_ns}"
+
+
+def prepared_key(path: str, enrich_path: str = ENRICH_CACHE_PATH) -> str:
+    # 원본 CSV + 보강 캐시의 크기/수정시각 + 토크나이저 + 규칙 버전 → 하나라도 바뀌면 새 키
+    raw = (f"{os.path.abspath(path)}|{_file_sig(path)}|{_file_sig(enrich_path)}|"
+           f"{TOKENIZER_NAME}|{PREPARED_VERSION}")
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def dataset_overview(df: pd.DataFrame, tokens: TokenIndex = None) -> dict:
+    # 사이드바/탭에서 전체 데이터 기준으로 쓰는 집계(필터와 무관)
+    out = {
+        "sources_all": sorted(df["source"].unique().tolist()),
+        "dom_top": df["domain"].value_counts().head(30).index.tolist(),
+    }
+    if tokens is not None:
+        # rising은 오늘 날짜 기준 → as_of가 오늘일 때만 재사용
+        out["as_of"] = date.today().isoformat()
+        out["rising"] = rising_keywords(df, recent_days=30, n=15, tokens=tokens)
+    return out
+
+
+def build_prepared(path: str, enrich_path: str = ENRICH_CACHE_PATH) -> dict:
+    from cooccur import build_index   # cooccur가 core를 import → 순환 방지
+    from snapshot import frame_hashes
+    df = normalize_frame(read_csv_safely(path))
+    df = attach_enrichments(df, load_enrichments(enrich_path))
+    tokens = build_tokens(df)
+    return {"df": df, "overview": dataset_overview(df, tokens), "tokens": tokens,
+            "cooccur": build_index(df, tokens), "hashes": frame_hashes(df)}
+
+
+def source_tag(path: str) -> str:
+    # 같은 원본 경로 + 토크나이저 설정끼리 같은 태그 → 캐시 폴더를 공유해도 정리 대상이 섞이지 않음
+    raw = f"{os.path.abspath(path)}|{TOKENIZER_NAME}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:8]
+
+
+def prepared_file(path: str, enrich_path: str = ENRICH_CACHE_PATH) -> str:
+    return os.path.join(CACHE_DIR, f"prepared-{source_tag(path)}-{prepared_key(path, enrich_path)}.pkl")
+
+
+def load_prepared(path: str, enrich_path: str = ENRICH_CACHE_PATH, rebuild: bool = False) -> dict:
+    # 디스크 캐시가 있으면 읽고, 없거나 깨졌으면 만들어서 저장
+    fp = prepared_file(path, enrich_path)
+    if not rebuild and os.path.exists(fp):
+        try:
+            with open(fp, "rb") as fh:
+                return pickle.load(fh)
+        except Exception:
+            pass  # 깨진 캐시 → 다시 만든다
+    bundle = build_prepared(path, enrich_path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{fp}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            pickle.dump(bundle, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, fp)   # 원자적 교체 → 동시에 여러 워커가 만들어도 안전
+    except OSError:
+        pass  # 읽기 전용 배포 환경이면 메모리 캐시만 사용
+    return bundle
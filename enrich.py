@@ -0,0 +1,246 @@
+# ============================================================
+# LLM 보강(enrichment) 배치 파이프라인 — 오프라인 전용
+# - 항목별 한 줄 요약 + 역할(ROLE_DEFS 중 하나) 제안을 미리 계산
+# - 본문 해시 키 JSONL 캐시 → 한 번 보낸 항목은 다시 보내지 않음
+# - 배치 + 동시 요청 제한 + 지수 백오프 재시도
+# - 앱(main.py)은 결과 파일만 읽는다(요청 경로에서 API 호출 없음)
+#
+# 사용:
+#   python enrich.py                      # OPENAI_API_KEY / OPENAI_BASE_URL 사용
+#   python enrich.py --stub               # 내장 스텁 서버로 오프라인 실행(테스트용)
+#   python enrich.py --base-url http://127.0.0.1:8808/v1 --api-key x
+# ============================================================
+
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core import DATA_PATH, ENRICH_CACHE_PATH, ROLE_NAMES, content_hash, classify_role, load_enrichments
+
+
+DEFAULT_MODEL = os.getenv("AI_AGENT_ENRICH_MODEL", "gpt-4o-mini")
+DESC_CHARS = 1200   # 프롬프트에 넣는 본문 길이 상한(토큰 비용 제한)
+
+SYSTEM_PROMPT = (
+    "You summarize AI-agent ecosystem items (papers, news, job posts) for Korean high-school and "
+    "college career classes. For each input item return a one-sentence Korean summary (max 120 chars) "
+    "and the single best-fitting role from the given role list. "
+    'Reply with JSON only: {"items": [{"id": ..., "summary": ..., "role": ...}]}'
+)
+
+
+# -------------------------------
+# Cache (write side)
+# -------------------------------
+class EnrichCache:
+    """content_hash → 결과 레코드. append-only JSONL이라 중간에 끊겨도 이미 쓴 줄은 유지된다."""
+
+    def __init__(self, path: str = ENRICH_CACHE_PATH):
+        self.path = path
+        self.records = load_enrichments(path)
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def put_many(self, records: list):
+        with self._lock, open(self.path, "a", encoding="utf-8") as fh:
+            for rec in records:
+                fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                self.records[rec["hash"]] = rec
+
+
+# -------------------------------
+# Client (pluggable)
+# -------------------------------
+class OpenAIEnrichClient:
+    """OpenAI 호환 Chat Completions 클라이언트. base_url만 바꾸면 스텁/사내 프록시로 대체된다."""
+
+    def __init__(self, model: str = DEFAULT_MODEL, base_url: str = None, api_key: str = None,
+                 timeout: float = 60.0):
+        from openai import AsyncOpenAI   # 배치 실행 시에만 필요 → 지연 import
+        self.model = model
+        self.client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout, max_retries=0)
+
+    async def enrich(self, items: list, roles: list) -> list:
+        payload = {"roles": roles, "items": items}
+        resp = await self.client.chat.completions.create(
+            model=self.model,
+            temperature=0,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+            ],
+        )
+        return json.loads(resp.choices[0].message.content).get("items", [])
+
+
+# -------------------------------
+# Stub server (offline tests)
+# -------------------------------
+def stub_answer(payload: dict) -> dict:
+    # 결정적 응답: 요약 = 제목 앞부분, 역할 = 규칙 기반 분류
+    out = []
+    for it in payload.get("items", []):
+        summary = re.sub(r"\s+", " ", it.get("title", "")).strip()[:120]
+        out.append({"id": it.get("id"), "summary": summary,
+                    "role": classify_role(it.get("title", ""), it.get("desc", ""), "")})
+    return {"items": out}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        user = next((m["content"] for m in body.get("messages", []) if m.get("role") == "user"), "{}")
+        content = json.dumps(stub_answer(json.loads(user)), ensure_ascii=False)
+        data = json.dumps({
+            "id": "stub", "object": "chat.completion", "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """OpenAI 호환 로컬 스텁(/v1/chat/completions). with 블록 안에서만 떠 있다."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# -------------------------------
+# Pipeline
+# -------------------------------
+def pending_items(rows, cache: EnrichCache) -> list:
+    # rows: (title, desc) 반복자. 캐시에 있거나 이번 실행에서 이미 본 본문은 제외
+    seen = set()
+    items = []
+    for title, desc in rows:
+        key = content_hash(title, desc)
+        if key in cache or key in seen:
+            continue
+        seen.add(key)
+        items.append({"id": key, "title": title, "desc": desc[:DESC_CHARS]})
+    return items
+
+
+async def _run_batch(client, batch: list, roles: list, sem: asyncio.Semaphore,
+                     max_retries: int, base_delay: float) -> list:
+    async with sem:
+        for attempt in range(max_retries + 1):
+            try:
+                return await client.enrich(batch, roles)
+            except Exception as e:
+                if attempt == max_retries:
+                    print(f"[enrich] batch 실패({len(batch)}개, 다음 실행에서 재시도): {e}")
+                    return []
+                # 지수 백오프 + jitter (동시 재시도가 한꺼번에 몰리지 않게)
+                await asyncio.sleep(base_delay * (2 ** attempt) * (0.5 + random.random()))
+    return []
+
+
+async def enrich_rows(rows, client, cache: EnrichCache, roles: list = ROLE_NAMES,
+                      batch_size: int = 8, concurrency: int = 4,
+                      max_retries: int = 4, base_delay: float = 1.0) -> dict:
+    items = pending_items(rows, cache)
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    sem = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def one(batch):
+        nonlocal done
+        results = await _run_batch(client, batch, roles, sem, max_retries, base_delay)
+        wanted = {it["id"] for it in batch}
+        recs = []
+        for r in results:
+            if not isinstance(r, dict) or r.get("id") not in wanted:
+                continue   # 모델이 지어낸 id는 버림
+            role = r.get("role") if r.get("role") in roles else ""
+            recs.append({"hash": r["id"], "summary": str(r.get("summary", "")).strip(), "role": role})
+        if recs:
+            cache.put_many(recs)   # 배치 단위로 즉시 저장 → 중단돼도 진행분 보존
+        done += len(recs)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(b) for b in batches))
+    return {
+        "pending": len(items),
+        "enriched": done,
+        "failed": len(items) - done,
+        "batches": len(batches),
+        "seconds": round(time.perf_counter() - t0, 2),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="LLM 요약/역할 제안을 미리 계산해 캐시에 저장")
+    ap.add_argument("--csv", default=DATA_PATH)
+    ap.add_argument("--cache", default=ENRICH_CACHE_PATH)
+    ap.add_argument("--model", default=DEFAULT_MODEL)
+    ap.add_argument("--base-url", default=os.getenv("OPENAI_BASE_URL"))
+    ap.add_argument("--api-key", default=os.getenv("OPENAI_API_KEY"))
+    ap.add_argument("--batch", type=int, default=8)
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--retries", type=int, default=4)
+    ap.add_argument("--limit", type=int, default=0, help="처리할 최대 항목 수(0=전체)")
+    ap.add_argument("--stub", action="store_true", help="내장 스텁 서버 사용(네트워크/키 불필요)")
+    args = ap.parse_args(argv)
+
+    from core import read_csv_safely, normalize_frame
+    df = normalize_frame(read_csv_safely(args.csv))
+    rows = list(zip(df["title"], df["desc"]))
+    if args.limit:
+        rows = rows[:args.limit]
+    cache = EnrichCache(args.cache)
+
+    def run(base_url, api_key):
+        client = OpenAIEnrichClient(model=args.model, base_url=base_url, api_key=api_key)
+        return asyncio.run(enrich_rows(rows, client, cache, batch_size=args.batch,
+                                       concurrency=args.concurrency, max_retries=args.retries))
+
+    if args.stub:
+        with StubServer() as srv:
+            stats = run(srv.base_url, "stub")
+    else:
+        stats = run(args.base_url, args.api_key)
+    print(f"[enrich] {json.dumps(stats, ensure_ascii=False)} · cache={len(cache)} → {args.cache}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# ============================================================
+# 내보내기(export) — 필터 결과/기록/메모를 CSV·JSONL·Parquet로
+# - 청크 단위 generator(bytes) → 파일로 쓰는 CLI/export_to_file은 메모리 사용이 청크 크기로 제한
+# - 앱(main.py)은 다운로드 버튼을 누를 때만 직렬화(callable). 결과 전체를 bytes로 만들고,
+#   작은 결과만 잠깐 캐시(main.export_filtered 참고)
+#
+# 사용(CLI):
+#   python export.py --format parquet --out agents.parquet
+#   python export.py --format jsonl --type paper --keyword evaluation --out eval.jsonl
+# ============================================================
+
+import io
+import json
+import argparse
+
+import pandas as pd
+
+
+CHUNK_ROWS = 5000
+
+EXPORT_FORMATS = {
+    # fmt: (mime, 확장자)
+    "csv": ("text/csv", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+# -------------------------------
+# Chunked writers
+# -------------------------------
+def _chunks(df: pd.DataFrame, chunk_rows: int):
+    for i in range(0, len(df), chunk_rows):
+        yield df.iloc[i:i + chunk_rows]
+
+
+def iter_csv(df: pd.DataFrame, chunk_rows: int = CHUNK_ROWS):
+    # 엑셀 호환을 위해 첫 청크에만 BOM + 헤더
+    if len(df) == 0:
+        yield df.to_csv(index=False).encode("utf-8-sig")
+        return
+    for i, chunk in enumerate(_chunks(df, chunk_rows)):
+        yield chunk.to_csv(index=False, header=(i == 0)).encode("utf-8-sig" if i == 0 else "utf-8")
+
+
+def iter_jsonl(df: pd.DataFrame, chunk_rows: int = CHUNK_ROWS):
+    for chunk in _chunks(df, chunk_rows):
+        text = chunk.to_json(orient="records", lines=True, date_format="iso", force_ascii=False)
+        yield (text if text.endswith("\n") else text + "\n").encode("utf-8")
+
+
+class _DrainSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모아뒀다가 청크마다 비워 내보내는 sink(위치는 누적 유지)."""
+
+    def __init__(self):
+        self.parts = []
+        self.pos = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.parts.append(bytes(b))
+        self.pos += len(b)
+        return len(b)
+
+    def tell(self):
+        return self.pos
+
+    def drain(self) -> bytes:
+        out = b"".join(self.parts)
+        self.parts = []
+        return out
+
+
+def iter_parquet(df: pd.DataFrame, chunk_rows: int = CHUNK_ROWS):
+    # 청크 = row group. pyarrow는 Streamlit 의존성이라 항상 있지만 지연 import
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _DrainSink()
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="zstd") as writer:
+        for chunk in _chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            data = sink.drain()
+            if data:
+                yield data
+    yield sink.drain()   # footer
+
+
+_WRITERS = {"csv": iter_csv, "jsonl": iter_jsonl, "parquet": iter_parquet}
+
+
+def iter_export(df: pd.DataFrame, fmt: str, chunk_rows: int = CHUNK_ROWS):
+    if fmt not in _WRITERS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {', '.join(_WRITERS)})")
+    return _WRITERS[fmt](df, chunk_rows)
+
+
+# -------------------------------
+# Sinks
+# -------------------------------
+def export_to_file(df: pd.DataFrame, fmt: str, path: str, chunk_rows: int = CHUNK_ROWS) -> int:
+    n = 0
+    with open(path, "wb") as fh:
+        for c in iter_export(df, fmt, chunk_rows):
+            fh.write(c)
+            n += len(c)
+    return n
+
+
+def main(argv=None):
+    from core import DATA_PATH, read_csv_safely, normalize_frame, apply_filters
+
+    ap = argparse.ArgumentParser(description="필터된 데이터셋을 CSV/JSONL/Parquet로 내보내기")
+    ap.add_argument("--csv", default=DATA_PATH)
+    ap.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    ap.add_argument("--out", required=True)
+    ap.add_argument("--since", help="YYYY-MM-DD")
+    ap.add_argument("--until", help="YYYY-MM-DD")
+    ap.add_argument("--source", action="append", help="여러 번 지정 가능")
+    ap.add_argument("--type", action="append", choices=["news", "paper", "job"])
+    ap.add_argument("--domain", action="append")
+    ap.add_argument("--keyword", default="")
+    ap.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = ap.parse_args(argv)
+
+    df = normalize_frame(read_csv_safely(args.csv))
+    f = apply_filters(
+        df,
+        start_d=pd.Timestamp(args.since).date() if args.since else None,
+        end_d=pd.Timestamp(args.until).date() if args.until else None,
+        sources=args.source, types=args.type, domains=args.domain, keyword=args.keyword,
+    )
+    n = export_to_file(f, args.format, args.out, args.chunk_rows)
+    print(json.dumps({"rows": len(f), "bytes": n, "out": args.out}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+# ============================================================
+# 수업 부하 테스트 — 학생 30~40명이 한꺼번에 접속해 탭을 오가는 상황을 재현
+# - 세션 1개 = Streamlit AppTest(헤드리스) 1개 = 브라우저 탭 1개
+#   모든 세션이 한 프로세스(스레드)에서 돈다 → 실제 서버처럼 CPU/GIL/캐시를 나눠 쓴다
+# - 시나리오: 첫 접속 → 필터 변경(타입/키워드) → ③ 사례 선택·기록 추가
+#             → ④ 기준 아이템 선택·주제 기록 → 질문 제출 (--rounds 만큼 반복)
+# - 상호작용별 재실행 지연 p50/p90/p95/p99/max + 프로세스 CPU·메모리(RSS) 샘플
+# - 측정 범위: 서버 쪽 스크립트 재실행 시간. 웹소켓 전송/브라우저 렌더링은 포함하지 않음
+#
+# 사용:
+#   python loadtest.py                                  # 35세션, 시나리오 2회
+#   python loadtest.py --sessions 40 --rounds 3 --ramp 20 --think 1 4
+#   python loadtest.py --json loadtest.json             # 결과를 파일로도 저장
+# ============================================================
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import psutil   # 선택: 없으면 /proc(리눅스)로 RSS를 읽는다
+except ImportError:
+    psutil = None
+
+
+# share_server_state가 흉내 내는 AppTest 내부 구조(Runtime mock 구성 등)가 같은 범위. 1.61.0/1.66.0에서 확인
+STREAMLIT_RANGE = ((1, 61), (1, 67))
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+STEPS = ["open", "filter_type", "filter_keyword", "pick_item", "add_record",
+         "pick_base", "add_note", "ask_question"]
+QUESTIONS = [
+    "문과도 AI 관련 진로가 가능할까요?",
+    "코딩을 못해도 평가자 역할을 할 수 있나요?",
+    "대학 전공은 무엇을 고르는 게 좋을까요?",
+    "지금부터 어떤 공부를 준비하면 될까요?",
+    "AI 때문에 일자리가 줄어들까 걱정돼요.",
+]
+
+
+# -------------------------------
+# Server resources
+# -------------------------------
+def rss_bytes():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class ResourceSampler(threading.Thread):
+    """일정 간격으로 프로세스 CPU 사용률(% of 1 core)과 RSS를 기록."""
+
+    def __init__(self, interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []   # (경과 초, cpu %, rss bytes)
+        self._done = threading.Event()
+
+    def run(self):
+        t0 = last_wall = time.perf_counter()
+        last_cpu = time.process_time()
+        while not self._done.wait(self.interval):
+            wall, cpu = time.perf_counter(), time.process_time()
+            self.samples.append((wall - t0, (cpu - last_cpu) / (wall - last_wall) * 100, rss_bytes()))
+            last_wall, last_cpu = wall, cpu
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+# -------------------------------
+# AppTest setup
+# -------------------------------
+def check_streamlit():
+    # 범위 밖 버전은 세션 도중 알 수 없는 오류로 깨지기 전에 바로 멈춘다
+    import streamlit
+    ver = tuple(int(x) for x in re.findall(r"\d+", streamlit.__version__)[:2])
+    (lo_major, lo_minor), (hi_major, hi_minor) = STREAMLIT_RANGE
+    if not STREAMLIT_RANGE[0] <= ver < STREAMLIT_RANGE[1]:
+        raise SystemExit(f"loadtest.py는 streamlit>={lo_major}.{lo_minor},<{hi_major}.{hi_minor}가 필요합니다 "
+                         f"(설치됨: {streamlit.__version__}). AppTest 내부 구조에 의존하기 때문입니다.")
+
+
+def share_server_state():
+    # AppTest는 단일 세션용이라 run마다 전역 Runtime을 자기 mock으로 바꿨다가 None으로 되돌린다.
+    # 여러 세션을 동시에 돌리면 서로의 Runtime을 지워 버림(KeyError, 캐시 유실) →
+    # 실제 서버처럼 Runtime 하나를 모든 세션이 공유하고, AppTest의 교체는 별도 클래스로 돌린다
+    import contextlib
+    from unittest.mock import MagicMock
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.components.v2.component_manager import BidiComponentManager
+    from streamlit.testing.v1 import app_test, local_script_runner
+    from streamlit.logger import set_log_level
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = DataframeSourceManager()
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    runtime.bidi_component_registry = BidiComponentManager()
+    runtime.bidi_component_registry.discover_and_register_components(start_file_watching=False)
+    Runtime._instance = runtime
+
+    class _PerRunRuntime(Runtime):
+        _instance = None
+
+    app_test.Runtime = _PerRunRuntime
+
+    # run마다 config.get_option을 mock으로 바꿨다 되돌리는 것도 전역 → 한 번만 켜 두고 교체는 생략
+    config.set_option("global.appTest", True)
+    # 세션 수만큼 반복되는 경고(ScriptRunContext, use_container_width)가 결과를 덮지 않게
+    config.set_option("logger.level", "error")
+    set_log_level("error")
+    app_test.patch_config_options = lambda overrides: contextlib.nullcontext()
+
+    # run마다 새 ScriptCache → main.py를 매번 컴파일. 서버처럼 하나를 공유(3.11 동시 ast.parse 충돌도 피함)
+    shared = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: shared
+
+
+def find(widgets, label: str):
+    return next((w for w in widgets if w.label == label), None)
+
+
+# -------------------------------
+# Simulated student
+# -------------------------------
+class Session:
+    """학생 한 명. 위젯을 조작하고 재실행(run) 시간만 잰다."""
+
+    def __init__(self, sid: int, keywords: list, think: tuple, timeout: float, stats: "Stats"):
+        from streamlit.testing.v1 import AppTest
+        self.sid = sid
+        self.rng = random.Random(sid)
+        self.keywords = keywords
+        self.think = think
+        self.stats = stats
+        self.at = AppTest.from_file(APP_SCRIPT, default_timeout=timeout)
+
+    def step(self, name: str, action=None):
+        # action: 위젯 값을 바꾸고 True, 대상 위젯이 없으면(필터 결과 0건 등) False → 건너뜀
+        if action is not None and not action(self.at):
+            self.stats.skip(name)
+            return
+        time.sleep(self.rng.uniform(*self.think))   # 학생이 읽고 고르는 시간
+        error = None
+        with self.stats.inflight():
+            t0 = time.perf_counter()
+            try:
+                self.at.run()
+            except Exception as e:   # 타임아웃 등
+                error = f"{type(e).__name__}: {e}"
+            sec = time.perf_counter() - t0
+        if error is None and len(self.at.exception):
+            error = str(self.at.exception[0].message).splitlines()[0]
+        self.stats.add(name, sec, error)
+
+    def round(self):
+        rng = self.rng
+
+        def pick_types(at):
+            w = find(at.multiselect, "콘텐츠 타입")
+            if w is None or not w.options:
+                return False
+            w.set_value(rng.sample(w.options, rng.randint(1, len(w.options))))
+            return True
+
+        def pick_keyword(at):
+            w = find(at.text_input, "키워드 검색")
+            if w is None:
+                return False
+            w.input(rng.choice(self.keywords + ["", ""]))   # 1/3쯤은 검색어를 비운다
+            return True
+
+        def pick_from(label):
+            def action(at):
+                w = find(at.selectbox, label)
+                if w is None or not w.options:
+                    return False
+                w.set_value(rng.choice(w.options))
+                return True
+            return action
+
+        def add_record(at):
+            w, b = find(at.text_input, "한 줄 해석(내 언어로)"), find(at.button, "📌 기록 추가")
+            if w is None or b is None:
+                return False
+            w.input(f"세션 {self.sid}의 해석")
+            b.click()
+            return True
+
+        def add_note(at):
+            b = find(at.button, "📌 이 주제(키워드)를 기록에 추가")
+            if b is None:
+                return False
+            b.click()
+            return True
+
+        def ask(at):
+            w, b = find(at.text_area, "질문을 적어주세요"), find(at.button, "📥 질문 제출")
+            if w is None or b is None:
+                return False
+            w.input(rng.choice(QUESTIONS))
+            b.click()
+            return True
+
+        self.step("filter_type", pick_types)
+        self.step("filter_keyword", pick_keyword)
+        self.step("pick_item", pick_from("사례 선택(최근순 상위 400개)"))
+        self.step("add_record", add_record)
+        self.step("pick_base", pick_from("기준 아이템 선택(최근순 상위 400개)"))
+        self.step("add_note", add_note)
+        self.step("ask_question", ask)
+
+    def play(self, rounds: int, delay: float):
+        time.sleep(delay)   # 입장 분산(ramp-up)
+        self.step("open")
+        for _ in range(rounds):
+            self.round()
+
+
+# -------------------------------
+# Results
+# -------------------------------
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency = {s: [] for s in STEPS}
+        self.errors = {s: [] for s in STEPS}
+        self.skipped = {s: 0 for s in STEPS}
+        self.running = 0
+        self.peak_running = 0
+
+    def add(self, name: str, sec: float, error=None):
+        with self.lock:
+            self.latency[name].append(sec)
+            if error:
+                self.errors[name].append(error)
+
+    def skip(self, name: str):
+        with self.lock:
+            self.skipped[name] += 1
+
+    def inflight(self):
+        stats = self
+
+        class _Inflight:
+            def __enter__(self):
+                with stats.lock:
+                    stats.running += 1
+                    stats.peak_running = max(stats.peak_running, stats.running)
+
+            def __exit__(self, *exc):
+                with stats.lock:
+                    stats.running -= 1
+
+        return _Inflight()
+
+
+def percentiles(values: list) -> dict:
+    if not values:
+        return {}
+    ms = np.asarray(values) * 1000
+    p50, p90, p95, p99 = np.percentile(ms, [50, 90, 95, 99])
+    return {"p50": round(p50, 1), "p90": round(p90, 1), "p95": round(p95, 1),
+            "p99": round(p99, 1), "max": round(float(ms.max()), 1)}
+
+
+def summarize(stats: Stats, sampler: ResourceSampler, wall: float, base_rss, config: dict) -> dict:
+    runs = sum(len(v) for v in stats.latency.values())
+    interactions = {
+        s: {"runs": len(stats.latency[s]), "errors": len(stats.errors[s]), "skipped": stats.skipped[s],
+            **percentiles(stats.latency[s])}
+        for s in STEPS
+    }
+    cpu = [c for _, c, _ in sampler.samples]
+    rss = [r for _, _, r in sampler.samples if r is not None]
+    mb = lambda b: round(b / 2**20, 1)
+    out = {
+        "config": config,
+        "wall_seconds": round(wall, 1),
+        "runs": runs,
+        "runs_per_second": round(runs / wall, 2) if wall else 0,
+        "peak_concurrent_runs": stats.peak_running,
+        "all": percentiles([x for v in stats.latency.values() for x in v]),
+        "interactions": interactions,
+        "cpu_percent": {"avg": round(float(np.mean(cpu)), 1), "peak": round(float(np.max(cpu)), 1),
+                        "cores": os.cpu_count()} if cpu else {},
+        "rss_mb": {},
+        "error_samples": sorted({e for v in stats.errors.values() for e in v})[:5],
+    }
+    if rss and base_rss:
+        out["rss_mb"] = {"before": mb(base_rss), "peak": mb(max(rss)), "end": mb(rss[-1]),
+                         "per_session": mb((max(rss) - base_rss) / max(config["sessions"], 1))}
+    return out
+
+
+def report(res: dict) -> str:
+    cols = ["runs", "errors", "skipped", "p50", "p90", "p95", "p99", "max"]
+    lines = [f"  {'interaction'.ljust(14)}" + "".join(c.rjust(9) for c in cols)]
+    for name, row in [*res["interactions"].items(), ("(all)", {"runs": res["runs"], **res["all"]})]:
+        lines.append(f"  {name.ljust(14)}" + "".join(str(row.get(c, "-")).rjust(9) for c in cols))
+    lines.append(f"  latency in ms · {res['runs']:,} runs in {res['wall_seconds']}s "
+                 f"({res['runs_per_second']}/s) · peak concurrent runs {res['peak_concurrent_runs']}")
+    if res["cpu_percent"]:
+        c = res["cpu_percent"]
+        lines.append(f"  cpu: avg {c['avg']}% · peak {c['peak']}% (100% = 1 core, {c['cores']} cores)")
+    if res["rss_mb"]:
+        r = res["rss_mb"]
+        lines.append(f"  rss: {r['before']} MB before → peak {r['peak']} MB · end {r['end']} MB "
+                     f"(~{r['per_session']} MB/session)")
+    for e in res["error_samples"]:
+        lines.append(f"  error: {e}")
+    return "\n".join(lines)
+
+
+# -------------------------------
+# Runner
+# -------------------------------
+def run_load(sessions: int, rounds: int, ramp: float, think: tuple, timeout: float,
+             cold: bool = False, sample: float = 0.5) -> dict:
+    from core import DATA_PATH, load_prepared
+
+    check_streamlit()
+    share_server_state()
+    bundle = load_prepared(DATA_PATH)   # 디스크 캐시 준비(warmup.py와 같은 단계)
+    keywords = [w for w, _ in bundle["tokens"].most_common(40)]
+    if not cold:
+        # 배포 직후 누군가 한 번 열어 본 상태(st.cache_data가 찬 상태)에서 시작
+        Session(-1, keywords, (0, 0), timeout, Stats()).step("open")
+
+    stats = Stats()
+    base_rss = rss_bytes()
+    sampler = ResourceSampler(sample)
+    sampler.start()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        people = [Session(i, keywords, think, timeout, stats) for i in range(sessions)]
+        futures = [pool.submit(p.play, rounds, i * ramp / sessions) for i, p in enumerate(people)]
+        for fut in futures:
+            fut.result()
+    wall = time.perf_counter() - t0
+    sampler.stop()
+
+    config = {"sessions": sessions, "rounds": rounds, "ramp": ramp, "think": list(think),
+              "cold": cold, "rows": len(bundle["df"]), "data": DATA_PATH}
+    return summarize(stats, sampler, wall, base_rss, config)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="동시 접속 세션 부하 테스트(헤드리스 AppTest)")
+    ap.add_argument("--csv", help="기본값: AI_AGENT_CSV_PATH 또는 core.DEFAULT_PATH")
+    ap.add_argument("--sessions", type=int, default=35, help="동시 학생 수")
+    ap.add_argument("--rounds", type=int, default=2, help="세션당 시나리오 반복 횟수")
+    ap.add_argument("--ramp", type=float, default=5.0, help="전원 입장까지 걸리는 초")
+    ap.add_argument("--think", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"),
+                    help="상호작용 사이 대기 초(균등 분포)")
+    ap.add_argument("--timeout", type=float, default=120.0, help="재실행 1회 제한 초")
+    ap.add_argument("--cold", action="store_true", help="st.cache_data가 빈 상태에서 시작")
+    ap.add_argument("--json", help="결과 JSON 저장 경로")
+    args = ap.parse_args(argv)
+    if args.csv:
+        os.environ["AI_AGENT_CSV_PATH"] = args.csv   # core import 전에
+
+    res = run_load(args.sessions, args.rounds, args.ramp, tuple(args.think), args.timeout, cold=args.cold)
+    print(f"[loadtest] {args.sessions} sessions × {args.rounds} rounds · {res['config']['rows']:,} rows")
+    print(report(res))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(res, fh, ensure_ascii=False, indent=2)
+    return 1 if res["error_samples"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
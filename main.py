@@ -13,6 +13,16 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from core import (
+    DATA_PATH, ENRICH_CACHE_PATH, ROLE_DEFS, ROLE_TO_SKILLS,
+    SKILL_TECH, SKILL_COG, SKILL_ATT,
+    normalize_frame, apply_filters, load_enrichments, attach_enrichments,
+    prepared_key, load_prepared, dataset_overview, build_tokens, top_keywords, rising_keywords,
+)
+from export import EXPORT_FORMATS, iter_export
+from cooccur import SCORES, association, build_index
+from snapshot import SNAPSHOT_DIR, Fingerprint, diff_rows, frame_hashes, list_snapshots
+
 
 # -------------------------------
 # Page config
@@ -21,207 +31,66 @@ st.set_page_config(page_title="AI Agents 트렌드 × 진로교육", layout="wid
 
 
 # -------------------------------
-# Constants
+# Helpers
 # -------------------------------
-DEFAULT_PATH = "AI_Agents_Ecosystem_2026.csv"
-DATA_PATH = os.getenv("AI_AGENT_CSV_PATH", DEFAULT_PATH)
-
-STOP_EN = {
-    "the","and","with","for","from","this","that","into","onto","over","under","about","between",
-    "using","use","used","new","latest","toward","towards","via","based","approach","system","systems",
-    "paper","research","study","studies","results","method","methods","model","models","dataset","data",
-    "ai","agent","agents","llm","llms","gpt","openai","anthropic","google","meta","microsoft",
-    "framework","tool","tools","application","applications","analysis","report","reports",
-    "build","building","improve","improving","improved","evaluate","evaluation","evaluating","benchmark",
-    "release","released","update","updated","updates","today","yesterday","tomorrow"
-}
-
-ROLE_DEFS = [
-    ("설계자(기획/구조화/오케스트레이션)", [
-        r"\borchestrat", r"\bworkflow", r"\bpipeline", r"\bplanner", r"\bplanning",
-        r"\barchitecture", r"\bdesign", r"\brouter", r"\bcoordinator", r"\bprompt\s*design"
-    ]),
-    ("구현자(개발/자동화)", [
-        r"\bimplement", r"\bimplementation", r"\bbuild", r"\bdev", r"\bdeveloper",
-        r"\bcode", r"\blibrary", r"\bsdk\b", r"\bapi\b", r"\bintegration", r"\bplugin",
-        r"\bgithub\b", r"\btypescript\b", r"\bpython\b", r"\bnode\b"
-    ]),
-    ("운영자(배포/모니터링/MLOps)", [
-        r"\bdeploy", r"\bdeployment", r"\bops\b", r"\bmlops\b", r"\bmonitor",
-        r"\bobservability", r"\bproduction", r"\breliability", r"\binfra", r"\bkubernetes",
-        r"\bserver", r"\bscaling", r"\blatency"
-    ]),
-    ("분석가(리서치/데이터)", [
-        r"\barxiv\b", r"\bpaper\b", r"\bstudy\b", r"\bdata\b", r"\bdataset\b",
-        r"\bstat", r"\bempirical", r"\bexperiment", r"\bmethodology", r"\btheory",
-        r"\bsurvey\b"
-    ]),
-    ("평가자(Eval/검증/안전)", [
-        r"\beval", r"\bevaluation", r"\bbenchmark", r"\btest", r"\btesting",
-        r"\bverification", r"\bvalidat", r"\bsafety", r"\balignment", r"\brisk",
-        r"\bguardrail", r"\bpolicy"
-    ]),
-    ("커뮤니케이터(교육/PM/번역)", [
-        r"\bguide\b", r"\btutorial", r"\bexplainer", r"\bdocument", r"\bdocumentation",
-        r"\bcommunity", r"\bproduct", r"\bpm\b", r"\bteaching", r"\bcourse", r"\bwriting"
-    ]),
-]
-
-SKILL_TECH = ["Python", "API/연동", "데이터 처리", "LLM/RAG", "에이전트/워크플로우", "클라우드/배포", "보안/윤리"]
-SKILL_COG  = ["문제정의", "구조화", "실험/검증", "논리적 글쓰기", "모델링/추론", "정보탐색", "시스템 사고"]
-SKILL_ATT  = ["자기주도", "협업", "불확실성 감내", "학습 민첩성", "책임감", "사용자 관점", "끈기"]
-
-ROLE_TO_SKILLS = {
-    "설계자(기획/구조화/오케스트레이션)": {
-        "tech": ["API/연동", "에이전트/워크플로우", "LLM/RAG"],
-        "cog": ["문제정의", "구조화", "시스템 사고", "정보탐색"],
-        "att": ["사용자 관점", "협업", "학습 민첩성"]
-    },
-    "구현자(개발/자동화)": {
-        "tech": ["Python", "API/연동", "데이터 처리", "에이전트/워크플로우"],
-        "cog": ["구조화", "문제정의", "정보탐색"],
-        "att": ["자기주도", "끈기", "책임감"]
-    },
-    "운영자(배포/모니터링/MLOps)": {
-        "tech": ["클라우드/배포", "API/연동", "보안/윤리"],
-        "cog": ["시스템 사고", "실험/검증", "문제정의"],
-        "att": ["책임감", "불확실성 감내", "협업"]
-    },
-    "분석가(리서치/데이터)": {
-        "tech": ["데이터 처리", "Python", "LLM/RAG"],
-        "cog": ["실험/검증", "논리적 글쓰기", "정보탐색", "모델링/추론"],
-        "att": ["학습 민첩성", "끈기", "자기주도"]
-    },
-    "평가자(Eval/검증/안전)": {
-        "tech": ["보안/윤리", "데이터 처리", "LLM/RAG"],
-        "cog": ["실험/검증", "문제정의", "논리적 글쓰기"],
-        "att": ["책임감", "불확실성 감내", "사용자 관점"]
-    },
-    "커뮤니케이터(교육/PM/번역)": {
-        "tech": ["API/연동", "LLM/RAG"],
-        "cog": ["논리적 글쓰기", "문제정의", "정보탐색"],
-        "att": ["협업", "사용자 관점", "책임감"]
-    },
-}
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_data(path: str, version: str = "") -> dict:
+    # 정규화 + LLM 보강 + 집계 번들. warmup.py가 미리 만든 디스크 캐시가 있으면 읽기만 한다
+    # version(원본/보강 파일 시그니처)은 캐시 키 용도 → 파일이 바뀌면 다시 읽는다
+    # 읽기 전용이라 cache_resource: 모든 세션이 한 객체를 공유(cache_data는 rerun마다 번들 전체를 복사)
+    return load_prepared(path)
 
 
-# -------------------------------
-# Helpers
-# -------------------------------
-@st.cache_data(show_spinner=False)
-def read_csv_safely(path: str) -> pd.DataFrame:
-    # 인코딩 fallback (utf-8 → cp949 → latin1)
-    last_err = None
-    for enc in ("utf-8", "cp949", "latin1"):
-        try:
-            return pd.read_csv(path, encoding=enc)
-        except Exception as e:
-            last_err = e
-    raise last_err
+EXPORT_CACHE_ROWS = 20_000   # 이보다 큰 필터 결과는 캐시하지 않음(20k행 ≈ CSV 10MB · JSONL 13MB)
 
 
-@st.cache_data(show_spinner=False)
-def load_data(path: str) -> pd.DataFrame:
-    df = read_csv_safely(path)
-
-    # normalize columns (case-insensitive)
-    cols = {c.strip().lower(): c for c in df.columns}
-    need = ["title", "source", "date", "description", "link"]
-    missing = [n for n in need if n not in cols]
-    if missing:
-        raise ValueError(f"CSV 컬럼이 예상과 다릅니다. 필요한 컬럼: {', '.join([n.title() for n in need])}")
-
-    df = df.rename(columns={
-        cols["title"]: "title",
-        cols["source"]: "source",
-        cols["date"]: "date",
-        cols["description"]: "desc",
-        cols["link"]: "link",
-    })
-
-    # sanitize types
-    for c in ["title", "source", "desc", "link"]:
-        df[c] = df[c].astype(str).fillna("").str.strip()
-
-    # parse date
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-
-    # domain
-    df["domain"] = df["link"].str.extract(r"https?://([^/]+)", expand=False).fillna("")
-
-    # content type (source-based)
-    s = df["source"].str.lower()
-    df["content_type"] = "news"
-    df.loc[s.str.contains("arxiv"), "content_type"] = "paper"
-    df.loc[s.str.contains("job"), "content_type"] = "job"
-
-    # role classification (rule-based)
-    def classify_role(title: str, desc: str, source: str) -> str:
-        text = f"{title} {desc} {source}".lower()
-        for role, patterns in ROLE_DEFS:
-            for p in patterns:
-                if re.search(p, text):
-                    return role
-        # fallback: content type cues
-        if "arxiv" in text:
-            return "분석가(리서치/데이터)"
-        return "설계자(기획/구조화/오케스트레이션)"
-
-    df["role"] = [classify_role(t, d, s) for t, d, s in zip(df["title"], df["desc"], df["source"])]
-
-    # drop empties + dedupe
-    df = df[(df["title"] != "") & (df["link"] != "")]
-    df = df.drop_duplicates(subset=["link"]).reset_index(drop=True)
-
-    # month/week for trends
-    if df["date"].notna().any():
-        df["month"] = df["date"].dt.to_period("M").astype(str)
-        df["week"] = df["date"].dt.to_period("W").astype(str)
-    else:
-        df["month"] = ""
-        df["week"] = ""
+@st.cache_data(show_spinner=False, max_entries=4, ttl=600)
+def cached_export(state: tuple, fmt: str, _f: pd.DataFrame) -> bytes:
+    # _f는 해시하지 않음(state가 키) → 같은 필터 상태면 직렬화 결과 재사용
+    return b"".join(iter_export(_f, fmt))
 
-    return df
 
+def export_filtered(state: tuple, fmt: str, f: pd.DataFrame) -> bytes:
+    """다운로드 클릭 시 직렬화. 결과 전체를 bytes로 만든다(download_button이 bytes를 요구).
 
-def tokenize_en(text: str):
-    tokens = re.findall(r"[A-Za-z][A-Za-z0-9\-\+]{2,}", str(text).lower())
-    tokens = [t for t in tokens if t not in STOP_EN]
-    return tokens
+    캐시 상한: EXPORT_CACHE_ROWS행 이하 결과만, 전체 세션 합쳐 4개, 10분 → 최대 약 50MB.
+    더 큰 결과는 클릭마다 새로 직렬화하고 캐시에 남기지 않는다.
+    """
+    if len(f) > EXPORT_CACHE_ROWS:
+        return b"".join(iter_export(f, fmt))
+    return cached_export(state, fmt, f)
 
 
-def top_keywords(df: pd.DataFrame, n=25):
-    tokens = []
-    for t, d in zip(df["title"], df["desc"]):
-        tokens.extend(tokenize_en(f"{t} {d}"))
-    c = Counter(tokens)
-    return c.most_common(n)
+@st.cache_resource(show_spinner=False, max_entries=4)
+def upload_indexes(key: tuple, _df: pd.DataFrame) -> dict:
+    # 업로드 데이터는 디스크 번들이 없으므로 토큰/집계/연관 행렬을 업로드 파일별로 한 번만 만든다
+    tokens = build_tokens(_df)
+    return {"overview": dataset_overview(_df, tokens), "tokens": tokens,
+            "cooccur": build_index(_df, tokens), "hashes": frame_hashes(_df)}
 
 
-def rising_keywords(df_all: pd.DataFrame, recent_days: int = 30, n=15):
-    if not df_all["date"].notna().any():
-        return []
+def snapshot_dir_version() -> float:
+    return os.path.getmtime(SNAPSHOT_DIR) if os.path.isdir(SNAPSHOT_DIR) else 0.0
 
-    cutoff = pd.Timestamp(date.today() - timedelta(days=recent_days))
-    recent = df_all[df_all["date"] >= cutoff]
-    if len(recent) == 0:
-        return []
 
-    all_counts = Counter(tokenize_en(" ".join((df_all["title"] + " " + df_all["desc"]).tolist())))
-    recent_counts = Counter(tokenize_en(" ".join((recent["title"] + " " + recent["desc"]).tolist())))
+@st.cache_data(show_spinner=False)
+def snapshot_list(version: float, current: str = "") -> list:
+    # 지문 메타만(행 수/생성 시각). version = 스냅샷 폴더 mtime
+    # current(지금 보고 있는 CSV)의 지문은 제외 → "새 항목 0건"뿐인 선택지를 보이지 않음
+    current = os.path.abspath(current) if current else ""
+    return [m for m in list_snapshots() if not current or m.get("source") != current]
+
 
-    # score = recent frequency normalized - overall frequency normalized
-    all_total = sum(all_counts.values()) or 1
-    recent_total = sum(recent_counts.values()) or 1
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_fingerprint(path: str, mtime: float) -> Fingerprint:
+    return Fingerprint.load(path)
 
-    scores = []
-    for k, rc in recent_counts.items():
-        ac = all_counts.get(k, 0)
-        score = (rc / recent_total) - (ac / all_total)
-        scores.append((k, score, rc, ac))
 
-    scores.sort(key=lambda x: x[1], reverse=True)
-    return scores[:n]
+def export_button(label: str, build, fmt: str, stem: str, key: str):
+    # build: 클릭 시에만 실행되는 callable(rerun마다 직렬화하지 않음)
+    mime, ext = EXPORT_FORMATS[fmt]
+    st.download_button(label, build, file_name=f"{stem}_{date.today().isoformat()}.{ext}",
+                       mime=mime, use_container_width=True, key=key)
 
 
 def item_label(row: pd.Series) -> str:
@@ -283,60 +152,31 @@ with st.sidebar:
             return dfu
 
         raw = load_uploaded(upload)
-        # 임시 파일 경로가 없으니 바로 정규화
-        # (간단히: dataframe을 csv로 저장 후 load_data에 넣는 대신, load_data 로직 일부 재사용)
-        df = raw.copy()
-        cols = {c.strip().lower(): c for c in df.columns}
-        need = ["title", "source", "date", "description", "link"]
-        missing = [n for n in need if n not in cols]
-        if missing:
-            st.error(f"업로드 CSV 컬럼이 맞지 않습니다: {', '.join(missing)}")
+        data_key = ("upload", getattr(upload, "file_id", upload.name))
+        # 임시 파일 경로가 없으니 바로 정규화(load_data와 같은 규칙)
+        try:
+            df = normalize_frame(raw.copy())
+            df = attach_enrichments(df, load_enrichments(ENRICH_CACHE_PATH))
+            bundle = upload_indexes(data_key, df)
+        except ValueError as e:
+            st.error(f"업로드 CSV 컬럼이 맞지 않습니다: {e}")
             st.stop()
-        df = df.rename(columns={
-            cols["title"]: "title",
-            cols["source"]: "source",
-            cols["date"]: "date",
-            cols["description"]: "desc",
-            cols["link"]: "link",
-        })
-        for c in ["title", "source", "desc", "link"]:
-            df[c] = df[c].astype(str).fillna("").str.strip()
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        df["domain"] = df["link"].str.extract(r"https?://([^/]+)", expand=False).fillna("")
-        s = df["source"].str.lower()
-        df["content_type"] = "news"
-        df.loc[s.str.contains("arxiv"), "content_type"] = "paper"
-        df.loc[s.str.contains("job"), "content_type"] = "job"
-
-        def classify_role_local(title: str, desc: str, source: str) -> str:
-            text = f"{title} {desc} {source}".lower()
-            for role, patterns in ROLE_DEFS:
-                for p in patterns:
-                    if re.search(p, text):
-                        return role
-            if "arxiv" in text:
-                return "분석가(리서치/데이터)"
-            return "설계자(기획/구조화/오케스트레이션)"
-        df["role"] = [classify_role_local(t, d, s) for t, d, s in zip(df["title"], df["desc"], df["source"])]
-
-        df = df[(df["title"] != "") & (df["link"] != "")]
-        df = df.drop_duplicates(subset=["link"]).reset_index(drop=True)
-        if df["date"].notna().any():
-            df["month"] = df["date"].dt.to_period("M").astype(str)
-            df["week"] = df["date"].dt.to_period("W").astype(str)
-        else:
-            df["month"] = ""
-            df["week"] = ""
     else:
         # 기본 경로 파일 로딩
         try:
-            df = load_data(DATA_PATH)
+            version = prepared_key(DATA_PATH)
+            bundle = load_data(DATA_PATH, version)
+            df = bundle["df"]
+            data_key = ("path", DATA_PATH, version)
         except Exception as e:
             st.error("CSV를 불러오지 못했습니다.")
             st.caption(str(e))
             st.markdown(f"- 기본 경로: `{DATA_PATH}`")
             st.stop()
 
+    # 로딩 시 한 번 만든 토큰/집계/연관 행렬 — 이후 필터 결과는 행 마스크로만 집계
+    overview, tok_index, cooc_index = bundle["overview"], bundle["tokens"], bundle["cooccur"]
+
     st.caption(f"데이터: {len(df):,}개 항목")
 
     st.divider()
@@ -355,18 +195,32 @@ with st.sidebar:
         start_d = end_d = None
         st.info("Date 파싱이 충분하지 않아 기간 필터가 제한됩니다.")
 
-    sources_all = sorted(df["source"].unique().tolist())
+    sources_all = overview["sources_all"]
     sources_sel = st.multiselect("Source", sources_all, default=sources_all)
 
     types_all = ["news", "paper", "job"]
     types_sel = st.multiselect("콘텐츠 타입", types_all, default=types_all)
 
     # domain top 30
-    dom_top = df["domain"].value_counts().head(30).index.tolist()
+    dom_top = overview["dom_top"]
     dom_sel = st.multiselect("도메인(상위 30)", dom_top, default=[])
 
     keyword = st.text_input("키워드 검색", placeholder="예: evaluation, agentic, RAG, orchestration ...")
 
+    # 스냅샷 비교: 옛 스냅샷은 지문(링크/본문 해시)만 읽는다
+    snaps = snapshot_list(snapshot_dir_version(), DATA_PATH if upload is None else "")
+    snap_labels = {m["path"]: f"{m['name']} ({m['rows']:,}개 · {m.get('created', '')[:10]})" for m in snaps}
+    snap_sel = st.selectbox("스냅샷 이후 새 항목만", [""] + list(snap_labels),
+                            format_func=lambda p: snap_labels.get(p, "(사용 안 함)"),
+                            help="`python snapshot.py scan`으로 등록된 스냅샷과 현재 데이터를 비교합니다.")
+    snap_mask = None
+    if snap_sel:
+        snap_changed = st.checkbox("내용이 바뀐 항목도 포함", value=False)
+        sd = diff_rows(load_fingerprint(snap_sel, os.path.getmtime(snap_sel)), *bundle["hashes"])
+        snap_mask = sd["added"] | sd["changed"] if snap_changed else sd["added"]
+        st.caption(f"신규 {int(sd['added'].sum()):,} · 변경 {int(sd['changed'].sum()):,} · "
+                   f"삭제 {sd['removed']:,} (삭제 항목은 현재 데이터에 없어 개수만 표시)")
+
     st.divider()
     st.header("🧑‍🏫 수업 옵션")
     audience = st.radio("대상", ["고3", "대학생"], horizontal=True)
@@ -374,16 +228,26 @@ with st.sidebar:
 
 
 # apply filters
-f = df.copy()
-if has_date and start_d and end_d:
-    f = f[(f["date"].dt.date >= start_d) & (f["date"].dt.date <= end_d)]
-f = f[f["source"].isin(sources_sel)]
-f = f[f["content_type"].isin(types_sel)]
-if dom_sel:
-    f = f[f["domain"].isin(dom_sel)]
-if keyword and keyword.strip():
-    k = keyword.strip().lower()
-    f = f[f["title"].str.lower().str.contains(k, na=False) | f["desc"].str.lower().str.contains(k, na=False)]
+f = apply_filters(
+    df,
+    start_d=start_d if has_date else None, end_d=end_d if has_date else None,
+    sources=sources_sel, types=types_sel, domains=dom_sel, keyword=keyword,
+)
+if snap_mask is not None:
+    f = f[snap_mask[f.index]]
+# 필터 상태 = 내보내기 캐시 키(데이터 원본 + 필터 값)
+filter_state = (data_key, str(start_d), str(end_d), tuple(sources_sel), tuple(types_sel),
+                tuple(dom_sel), (keyword or "").strip().lower(),
+                snap_sel, bool(snap_mask is not None and snap_changed))
+
+with st.sidebar:
+    st.divider()
+    st.header("⬇️ 내보내기")
+    export_fmt = st.selectbox("형식", list(EXPORT_FORMATS), index=0,
+                              help="CSV(엑셀) · JSONL(한 줄 = 한 항목) · Parquet(대용량/분석용)")
+    export_button(f"필터 결과 {len(f):,}건 다운로드",
+                  lambda s=filter_state, fmt=export_fmt, fr=f: export_filtered(s, fmt, fr),
+                  export_fmt, "ai_agents_filtered", "dl_filtered")
 
 
 # -------------------------------
@@ -455,12 +319,12 @@ with tab1:
 # ============================================================
 with tab2:
     st.subheader("키워드로 보는 ‘일의 중심축’ 변화")
-    st.caption("Title+Description에서 영문 키워드를 추출해 ‘무엇이 반복적으로 등장하는가’를 본다(간단 룰 기반).")
+    st.caption("Title+Description에서 영문/한글 키워드를 추출해 ‘무엇이 반복적으로 등장하는가’를 본다(간단 룰 기반).")
 
     colA, colB = st.columns(2)
 
     with colA:
-        kw = top_keywords(f, n=25)
+        kw = top_keywords(f, n=25, tokens=tok_index)
         if kw:
             kw_df = pd.DataFrame(kw, columns=["keyword", "count"])
             fig = px.bar(kw_df, x="keyword", y="count", title="키워드 Top 25(필터 기준)")
@@ -470,7 +334,11 @@ with tab2:
 
     with colB:
         if df["date"].notna().any():
-            rising = rising_keywords(df, recent_days=30, n=15)
+            # 전체 데이터 기준이라 필터와 무관 → 오늘 날짜로 미리 계산된 값이 있으면 재사용
+            if overview.get("as_of") == date.today().isoformat():
+                rising = overview["rising"]
+            else:
+                rising = rising_keywords(df, recent_days=30, n=15, tokens=tok_index)
             if rising:
                 r_df = pd.DataFrame(rising, columns=["keyword", "score", "recent_count", "all_count"])
                 fig = px.bar(r_df, x="keyword", y="score", title="최근 30일 ‘상승’ 키워드(간단 증감 점수)")
@@ -525,6 +393,26 @@ with tab3:
         else:
             st.info("Date가 없어 최근 30일 역할 비교가 제한됩니다.")
 
+    st.divider()
+    st.markdown("### 🔗 어떤 키워드가 그 역할을 만드는가(역할/콘텐츠 타입 × 키워드)")
+    hc1, hc2, hc3 = st.columns(3)
+    group_labels = {"role": "역할", "content_type": "콘텐츠 타입"}
+    assoc_group = hc1.radio("행 기준", list(group_labels), format_func=group_labels.get, horizontal=True)
+    assoc_score = hc2.radio("점수", list(SCORES), format_func=SCORES.get, index=1, horizontal=True)
+    assoc_k = hc3.slider("그룹별 키워드 수", 5, 20, 10)
+
+    # 전체 데이터로 만든 행렬에서 필터 결과 행만 남겨 계산(재토큰화 없음)
+    assoc = association(cooc_index, assoc_group, mask=df.index.isin(f.index), score=assoc_score, top_k=assoc_k)
+    if assoc.shape[1] == 0:
+        st.info("연관 키워드를 계산할 데이터가 부족합니다. 필터를 완화해보세요.")
+    else:
+        fig = px.imshow(assoc, aspect="auto", color_continuous_scale="Blues",
+                        labels=dict(x="keyword", y=group_labels[assoc_group], color=SCORES[assoc_score]),
+                        title=f"{group_labels[assoc_group]} × 키워드 연관({SCORES[assoc_score]}, 필터 기준)")
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption("Lift = 실제 함께 등장한 문서 수 ÷ 우연히 기대되는 수(1보다 크면 그 그룹에서 특히 자주 등장), "
+                   "PMI = log₂(Lift). 함께 등장한 문서가 3건 미만인 칸은 비워 둡니다.")
+
     st.divider()
     st.markdown("### 🎯 학생 활동: ‘나의 역할 Top 2’ 선택하기")
 
@@ -548,6 +436,10 @@ with tab3:
         st.caption(f"{row['source']} · {row['content_type']} · {row['domain']} · "
                    f"{row['date'].date() if pd.notna(row['date']) else ''} · 분류역할: {row['role']}")
         st.write(row["desc"][:900] + ("…" if len(row["desc"]) > 900 else ""))
+        if row["llm_summary"]:
+            st.info(f"🤖 AI 요약: {row['llm_summary']}")
+            if row["llm_role"]:
+                st.caption(f"AI 제안 역할: {row['llm_role']} (규칙 분류와 비교해보세요)")
         st.link_button("원문 보기", row["link"])
 
         st.markdown("#### 🔽 이 사례를 ‘나의 기록’에 추가")
@@ -598,7 +490,7 @@ with tab4:
         base_row = f_base.iloc[idx]
 
         # 자동 키워드 제안
-        auto_keys = Counter(tokenize_en(base_row["title"] + " " + base_row["desc"])).most_common(10)
+        auto_keys = Counter(tok_index.doc_tokens(base_row.name)).most_common(10)
         suggested = auto_keys[0][0] if auto_keys else ""
         key = st.text_input("키워드(자동 제안 → 수정 가능)", value=suggested)
 
@@ -661,6 +553,8 @@ with tab5:
     if not items and not notes:
         st.info("아직 기록이 없습니다. ③/④ 탭에서 사례 또는 주제를 기록해보세요.")
     else:
+        # 기록/메모는 사이드바(필터 결과) 형식과 따로 — 학생용이라 엑셀에서 바로 열리는 CSV가 기본
+        rec_fmt = st.radio("기록 파일 형식", list(EXPORT_FORMATS), index=0, horizontal=True, key="rec_fmt")
         if items:
             p = pd.DataFrame(items)
             st.markdown("### 1) 오늘 내가 만든 기록")
@@ -760,10 +654,9 @@ f"""[오늘의 진로 사고 확장 기록]
 
             colD1, colD2 = st.columns(2)
             with colD1:
-                csv_bytes = p.to_csv(index=False).encode("utf-8-sig")
-                st.download_button("⬇️ 기록 CSV 다운로드", csv_bytes,
-                                   file_name=f"career_portfolio_{date.today().isoformat()}.csv",
-                                   mime="text/csv", use_container_width=True)
+                export_button(f"⬇️ 기록 {rec_fmt.upper()} 다운로드",
+                              lambda recs=list(items), fmt=rec_fmt: b"".join(iter_export(pd.DataFrame(recs), fmt)),
+                              rec_fmt, "career_portfolio", "dl_portfolio")
             with colD2:
                 if st.button("🗑️ 기록 전체 삭제", use_container_width=True):
                     st.session_state["portfolio"] = []
@@ -775,6 +668,9 @@ f"""[오늘의 진로 사고 확장 기록]
             st.markdown("### 7) 주제 메모(키워드) 모아보기")
             ndf = pd.DataFrame(notes)
             st.dataframe(ndf, use_container_width=True, hide_index=True)
+            export_button(f"⬇️ 주제 메모 {rec_fmt.upper()} 다운로드",
+                          lambda recs=list(notes), fmt=rec_fmt: b"".join(iter_export(pd.DataFrame(recs), fmt)),
+                          rec_fmt, "career_notes", "dl_notes")
 
 
 # ============================================================
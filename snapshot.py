@@ -0,0 +1,234 @@
+# ============================================================
+# 스냅샷 지문(fingerprint) + 차이(diff)
+# - 스냅샷(CSV)마다 링크 해시 + 행 본문 해시(각 64bit)만 저장 → 행당 16바이트
+# - 지문은 CSV를 청크 단위로 한 번 훑어(streaming) 만든다. 옛 스냅샷 본문은 다시 읽지 않음
+# - 현재 데이터 vs 스냅샷 X: 신규(added) / 변경(changed) / 삭제(removed)
+#
+# 사용:
+#   python snapshot.py scan                 # AI_Agents_Ecosystem_*.csv 중 지문 없는 것 등록(현재 데이터 제외)
+#   python snapshot.py add PATH [--name N]  # 특정 CSV 등록
+#   python snapshot.py list
+#   python snapshot.py diff OLD NEW         # 지문 이름 또는 CSV 경로
+# ============================================================
+
+import os
+import glob
+import json
+import codecs
+import hashlib
+import argparse
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+SNAPSHOT_GLOB = os.getenv("AI_AGENT_SNAPSHOT_GLOB", "AI_Agents_Ecosystem_*.csv")
+SNAPSHOT_DIR = os.getenv("AI_AGENT_SNAPSHOT_DIR", "snapshots")
+CHUNK_ROWS = 50_000
+
+
+# -------------------------------
+# Hashing
+# -------------------------------
+def hash64(values) -> np.ndarray:
+    # 문자열 → 64bit 해시 배열(blake2b). 충돌 확률은 10만 행 기준 ~1e-10
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(v.encode("utf-8"), digest_size=8).digest(), "little") for v in values),
+        dtype=np.uint64,
+    )
+
+
+def frame_hashes(df: pd.DataFrame):
+    # df: 정규화된 스키마(title/desc/link). (링크 해시, 본문 해시) — 행 순서 유지
+    return hash64(df["link"]), hash64(df["title"] + "\n" + df["desc"])
+
+
+# -------------------------------
+# Fingerprint
+# -------------------------------
+class Fingerprint:
+    """스냅샷 하나의 지문. link는 정렬돼 있고 content는 link와 같은 순서."""
+
+    def __init__(self, link: np.ndarray, content: np.ndarray, meta: dict = None):
+        order = np.argsort(link, kind="stable")
+        self.link = link[order]
+        self.content = content[order]
+        self.meta = meta or {}
+
+    def __len__(self) -> int:
+        return len(self.link)
+
+    @property
+    def name(self) -> str:
+        return self.meta.get("name", "")
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp, link=self.link, content=self.content, meta=np.array(json.dumps(self.meta, ensure_ascii=False)))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Fingerprint":
+        with np.load(path) as z:
+            return cls(z["link"], z["content"], json.loads(str(z["meta"])))
+
+    def lookup(self, link: np.ndarray):
+        # 각 링크가 이 지문에 있는지 + 있으면 그 본문 해시(정렬 배열 이진 탐색)
+        if len(self.link) == 0:
+            return np.zeros(len(link), dtype=bool), np.zeros(len(link), dtype=np.uint64)
+        pos = np.minimum(np.searchsorted(self.link, link), len(self.link) - 1)
+        return self.link[pos] == link, self.content[pos]
+
+
+def detect_encoding(path: str) -> str:
+    # read_csv_safely와 같은 순서(utf-8 → cp949 → latin1). 파싱 없이 바이트만 점진 디코딩
+    for enc in ("utf-8", "cp949"):
+        dec = codecs.getincrementaldecoder(enc)()
+        try:
+            with open(path, "rb") as fh:
+                for block in iter(lambda: fh.read(1 << 20), b""):
+                    dec.decode(block)
+                dec.decode(b"", final=True)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return "latin1"
+
+
+def iter_chunks(path: str, chunk_rows: int = CHUNK_ROWS):
+    # 필요한 세 컬럼만, 청크 단위로. 정규화 규칙은 core.normalize_frame과 같게(astype→fillna→strip, 빈 값 제외)
+    need = {"title", "description", "link"}
+    enc = detect_encoding(path)
+    reader = pd.read_csv(path, encoding=enc, usecols=lambda c: c.strip().lower() in need,
+                         chunksize=chunk_rows)
+    for chunk in reader:
+        cols = {c.strip().lower(): c for c in chunk.columns}
+        if need - set(cols):
+            raise ValueError(f"CSV 컬럼이 예상과 다릅니다: {path}")
+        out = pd.DataFrame({
+            "title": chunk[cols["title"]].astype(str).fillna("").str.strip(),
+            "desc": chunk[cols["description"]].astype(str).fillna("").str.strip(),
+            "link": chunk[cols["link"]].astype(str).fillna("").str.strip(),
+        })
+        yield out[(out["title"] != "") & (out["link"] != "")]
+
+
+def fingerprint_csv(path: str, name: str = None, chunk_rows: int = CHUNK_ROWS) -> Fingerprint:
+    links, contents = [], []
+    seen = set()
+    for chunk in iter_chunks(path, chunk_rows):
+        lh, ch = frame_hashes(chunk)
+        # 링크 중복은 처음 것만(normalize_frame의 drop_duplicates와 같음)
+        keep = np.fromiter((h not in seen and not seen.add(h) for h in lh.tolist()), dtype=bool, count=len(lh))
+        links.append(lh[keep])
+        contents.append(ch[keep])
+    meta = {
+        "name": name or os.path.splitext(os.path.basename(path))[0],
+        "source": os.path.abspath(path),
+        "created": datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds"),
+    }
+    empty = np.zeros(0, np.uint64)
+    return Fingerprint(np.concatenate(links) if links else empty, np.concatenate(contents) if contents else empty, meta)
+
+
+# -------------------------------
+# Registry
+# -------------------------------
+def fp_path(name: str, snap_dir: str = SNAPSHOT_DIR) -> str:
+    return os.path.join(snap_dir, f"{name}.npz")
+
+
+def list_snapshots(snap_dir: str = SNAPSHOT_DIR) -> list:
+    # 메타만 읽음(배열 전체를 올리지 않음). 최신 순
+    out = []
+    for fp in glob.glob(os.path.join(snap_dir, "*.npz")):
+        try:
+            with np.load(fp) as z:
+                meta = json.loads(str(z["meta"]))
+                meta["rows"] = int(z["link"].shape[0])
+        except Exception:
+            continue
+        meta["path"] = fp
+        out.append(meta)
+    return sorted(out, key=lambda m: m.get("created", ""), reverse=True)
+
+
+def add_snapshot(path: str, name: str = None, snap_dir: str = SNAPSHOT_DIR) -> Fingerprint:
+    fp = fingerprint_csv(path, name)
+    fp.save(fp_path(fp.name, snap_dir))
+    return fp
+
+
+def scan(pattern: str = SNAPSHOT_GLOB, snap_dir: str = SNAPSHOT_DIR, exclude=()) -> list:
+    # 지문이 없거나 원본이 더 새로우면 (재)등록. exclude = 현재 앱이 쓰는 데이터(자기 자신과의 비교는 항상 0건)
+    skip = {os.path.abspath(p) for p in exclude}
+    added = []
+    for path in sorted(glob.glob(pattern)):
+        if os.path.abspath(path) in skip:
+            continue
+        name = os.path.splitext(os.path.basename(path))[0]
+        target = fp_path(name, snap_dir)
+        if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+            continue
+        add_snapshot(path, name, snap_dir)
+        added.append(name)
+    return added
+
+
+# -------------------------------
+# Diff
+# -------------------------------
+def diff_rows(old: Fingerprint, link: np.ndarray, content: np.ndarray) -> dict:
+    # 현재 행(link/content, 행 순서 유지) 기준 상태 배열 + 삭제 수
+    found, old_content = old.lookup(link)
+    changed = found & (old_content != content)
+    return {
+        "added": ~found,
+        "changed": changed,
+        "removed": int(len(old) - np.isin(old.link, link[found]).sum()),
+    }
+
+
+def diff(old: Fingerprint, new: Fingerprint) -> dict:
+    d = diff_rows(old, new.link, new.content)
+    return {"added": int(d["added"].sum()), "changed": int(d["changed"].sum()), "removed": d["removed"],
+            "unchanged": int(len(new) - d["added"].sum() - d["changed"].sum())}
+
+
+def _resolve(ref: str) -> Fingerprint:
+    if ref.lower().endswith(".csv"):
+        return fingerprint_csv(ref)
+    return Fingerprint.load(ref if ref.endswith(".npz") else fp_path(ref))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="스냅샷 지문 등록/비교")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_scan = sub.add_parser("scan")
+    p_scan.add_argument("--glob", default=SNAPSHOT_GLOB)
+    p_add = sub.add_parser("add")
+    p_add.add_argument("path")
+    p_add.add_argument("--name")
+    sub.add_parser("list")
+    p_diff = sub.add_parser("diff")
+    p_diff.add_argument("old")
+    p_diff.add_argument("new")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "scan":
+        from core import DATA_PATH
+        print(json.dumps({"added": scan(args.glob, exclude=[DATA_PATH])}, ensure_ascii=False))
+    elif args.cmd == "add":
+        fp = add_snapshot(args.path, args.name)
+        print(json.dumps({"name": fp.name, "rows": len(fp)}, ensure_ascii=False))
+    elif args.cmd == "list":
+        for m in list_snapshots():
+            print(f"{m['name']}\t{m['rows']:,} rows\t{m.get('created', '')}")
+    else:
+        print(json.dumps(diff(_resolve(args.old), _resolve(args.new)), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# ============================================================
+# enrich.py 파이프라인 — 스텁 서버로 API 없이 확인
+#   python -m pytest -q test_enrich.py
+# ============================================================
+
+import asyncio
+
+from enrich import EnrichCache, OpenAIEnrichClient, StubServer, enrich_rows
+
+
+ROWS = [
+    ("Agent evaluation harness released", "A benchmark for multi-step tool use."),
+    ("Hiring: ML platform engineer", "Build and operate agent infrastructure."),
+    ("Agent evaluation harness released", "A benchmark for multi-step tool use."),   # 중복 본문
+    ("Survey of planning in LLM agents", "We review planning and memory methods."),
+]
+
+
+def run(rows, client, cache_path, **kwargs):
+    return asyncio.run(enrich_rows(rows, client, EnrichCache(str(cache_path)), **kwargs))
+
+
+def test_second_run_sends_nothing(tmp_path):
+    cache_path = tmp_path / "enrichments.jsonl"
+    with StubServer() as srv:
+        first = run(ROWS, OpenAIEnrichClient(base_url=srv.base_url, api_key="stub"), cache_path, batch_size=2)
+        second = run(ROWS, OpenAIEnrichClient(base_url=srv.base_url, api_key="stub"), cache_path, batch_size=2)
+
+    assert first["pending"] == 3 and first["enriched"] == 3 and first["failed"] == 0
+    assert second["pending"] == 0 and second["batches"] == 0
+    assert len(EnrichCache(str(cache_path))) == 3
+
+
+class FailingClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def enrich(self, items, roles):
+        self.calls += 1
+        raise ConnectionError("stub down")
+
+
+def test_failing_client_is_retried_then_reported(tmp_path):
+    cache_path = tmp_path / "enrichments.jsonl"
+    client = FailingClient()
+    res = run(ROWS, client, cache_path, batch_size=8, max_retries=2, base_delay=0)
+
+    assert client.calls == 3                     # 1회 + 재시도 2회
+    assert res["pending"] == 3 and res["failed"] == 3 and res["enriched"] == 0
+    assert len(EnrichCache(str(cache_path))) == 0   # 실패분은 다음 실행에서 다시 보낸다
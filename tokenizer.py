@@ -0,0 +1,221 @@
+# ============================================================
+# 토크나이저(영문 + 한글) — 코퍼스는 로딩 시 한 번만 배치 토큰화
+# - 등록형(pluggable): AI_AGENT_TOKENIZER=en | multi(기본) | bigram
+#   · en     : 기존 영문 규칙 그대로
+#   · multi  : 영문 + 한글 어절에서 조사/어미를 떼어낸 어간(가벼운 형태소 분리)
+#   · bigram : 영문 + 한글 음절 bigram(검색 재현율 우선)
+# - TokenIndex: 문서별 토큰을 (vocab, ids, indptr) 정수 배열로 압축 보관
+#   → 필터 부분집합의 키워드 빈도는 재토큰화 없이 bincount로 계산
+#
+# 벤치마크: python tokenizer.py [--repeat 20]
+# ============================================================
+
+import os
+import re
+import html
+import time
+import argparse
+from functools import lru_cache
+
+import numpy as np
+
+
+STOP_EN = {
+    "the","and","with","for","from","this","that","into","onto","over","under","about","between",
+    "using","use","used","new","latest","toward","towards","via","based","approach","system","systems",
+    "paper","research","study","studies","results","method","methods","model","models","dataset","data",
+    "ai","agent","agents","llm","llms","gpt","openai","anthropic","google","meta","microsoft",
+    "framework","tool","tools","application","applications","analysis","report","reports",
+    "build","building","improve","improving","improved","evaluate","evaluation","evaluating","benchmark",
+    "release","released","update","updated","updates","today","yesterday","tomorrow"
+}
+
+# 기능어 + STOP_EN과 같은 취지의 도메인 상투어
+STOP_KO = {
+    "그리고","그러나","하지만","또한","및","등","이","그","저","것","수","위해","통해","대한","대해",
+    "있는","있다","없는","하는","한다","했다","합니다","있습니다","됩니다","되는","된다","이번","오늘",
+    "최근","관련","경우","때문","그것","우리","여러","모든","같은","또는","더","가장","매우","기자",
+    "지난","현재","이후","이전","대해서","따라","함께","라고","이라고","밝혔다","말했다","전했다",
+    "인공지능","에이전트","모델","데이터","연구","논문","시스템","도구","기술","서비스","활용","개발",
+    "발표","출시","업데이트","분석","평가","방법","결과","기반",
+}
+
+# 길이가 긴 것부터 검사(예: "에서는"이 "는"보다 먼저)
+KO_SUFFIXES = sorted([
+    # 서술/어미
+    "합니다","했습니다","입니다","됩니다","하는","하다","했다","한다","된다","되는","하며","해서",
+    "하고","하여","되어","되며","으로써","으로서",
+    # 조사
+    "으로부터","에서부터","에게서","에서는","에서도","이라는","라는","에서","에게","한테","으로",
+    "부터","까지","보다","처럼","마다","이나","이며","이고","과의","와의","들은","들이","들을","들의",
+    "은","는","이","가","을","를","에","의","와","과","도","로","만","들",
+], key=len, reverse=True)
+
+TOKENIZER_NAME = os.getenv("AI_AGENT_TOKENIZER", "multi")
+
+_LATIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9\-\+]{2,}")
+_HANGUL_RE = re.compile(r"[가-힣]{2,}")
+
+
+# -------------------------------
+# Tokenizers
+# -------------------------------
+def tokenize_en(text: str):
+    tokens = _LATIN_RE.findall(str(text).lower())
+    tokens = [t for t in tokens if t not in STOP_EN]
+    return tokens
+
+
+def ko_stem(word: str) -> str:
+    # 어절 끝의 조사/어미 하나를 떼어냄(남는 어간이 2음절 이상일 때만)
+    for suf in KO_SUFFIXES:
+        if word.endswith(suf) and len(word) - len(suf) >= 2:
+            return word[:-len(suf)]
+    return word
+
+
+@lru_cache(maxsize=200_000)
+def _ko_term(word: str) -> str:
+    # 어절 → 불용어 제거된 어간("" = 버림). 한국어 어절은 반복이 많아 캐시 적중률이 높다
+    if word in STOP_KO:
+        return ""
+    stem = ko_stem(word)
+    return "" if stem in STOP_KO else stem
+
+
+def _prep(text) -> str:
+    text = str(text)
+    if "&" in text:   # HTML 엔티티(&#x27; 등)가 토큰으로 새지 않게
+        text = html.unescape(text)
+    return text.lower()
+
+
+def tokenize_multi(text: str):
+    text = _prep(text)
+    tokens = [t for t in _LATIN_RE.findall(text) if t not in STOP_EN]
+    if text.isascii():   # O(1) — 영문만 있는 문서는 한글 스캔 생략
+        return tokens
+    for w in _HANGUL_RE.findall(text):
+        stem = _ko_term(w)
+        if stem:
+            tokens.append(stem)
+    return tokens
+
+
+def tokenize_bigram(text: str):
+    text = _prep(text)
+    tokens = [t for t in _LATIN_RE.findall(text) if t not in STOP_EN]
+    if text.isascii():
+        return tokens
+    for w in _HANGUL_RE.findall(text):
+        stem = _ko_term(w)
+        tokens.extend(stem[i:i + 2] for i in range(len(stem) - 1))
+    return tokens
+
+
+TOKENIZERS = {
+    "en": tokenize_en,
+    "multi": tokenize_multi,
+    "bigram": tokenize_bigram,
+}
+
+
+def register_tokenizer(name: str, fn):
+    TOKENIZERS[name] = fn
+
+
+def get_tokenizer(name: str = None):
+    name = name or TOKENIZER_NAME
+    if name not in TOKENIZERS:
+        raise ValueError(f"알 수 없는 토크나이저: {name} (가능: {', '.join(TOKENIZERS)})")
+    return TOKENIZERS[name]
+
+
+# -------------------------------
+# Batch index
+# -------------------------------
+class TokenIndex:
+    """문서별 토큰열을 정수 배열로 압축한 인덱스. 행 순서 = 원본 DataFrame 행 위치."""
+
+    def __init__(self, vocab: list, ids: np.ndarray, indptr: np.ndarray):
+        self.vocab = vocab
+        self.ids = ids
+        self.indptr = indptr
+
+    @classmethod
+    def build(cls, texts, tokenizer=None) -> "TokenIndex":
+        fn = tokenizer or get_tokenizer()
+        vocab_ix = {}
+        ids = []
+        indptr = [0]
+        for text in texts:
+            for tok in fn(text):
+                j = vocab_ix.get(tok)
+                if j is None:
+                    j = vocab_ix[tok] = len(vocab_ix)
+                ids.append(j)
+            indptr.append(len(ids))
+        return cls(list(vocab_ix), np.asarray(ids, dtype=np.int32), np.asarray(indptr, dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def doc_tokens(self, i: int) -> list:
+        return [self.vocab[j] for j in self.ids[self.indptr[i]:self.indptr[i + 1]]]
+
+    def row_mask(self, positions) -> np.ndarray:
+        mask = np.zeros(len(self), dtype=bool)
+        mask[np.asarray(positions, dtype=np.int64)] = True
+        return mask
+
+    def counts(self, mask=None) -> np.ndarray:
+        # 단어별 등장 횟수(mask가 있으면 해당 문서만)
+        ids = self.ids
+        if mask is not None:
+            ids = ids[np.repeat(np.asarray(mask, dtype=bool), np.diff(self.indptr))]
+        return np.bincount(ids, minlength=len(self.vocab))
+
+    def most_common(self, n: int, mask=None) -> list:
+        c = self.counts(mask)
+        top = np.argsort(-c, kind="stable")[:n]
+        return [(self.vocab[j], int(c[j])) for j in top if c[j] > 0]
+
+
+# -------------------------------
+# Benchmark
+# -------------------------------
+def bench(texts: list, names=None) -> list:
+    # 토크나이저별 배치 처리량(docs/s, MB/s). multi가 en 대비 몇 배 느린지 확인용
+    size_mb = sum(len(t.encode("utf-8")) for t in texts) / 1e6
+    rows = []
+    for name in names or list(TOKENIZERS):
+        TokenIndex.build(texts[:200], get_tokenizer(name))   # regex/캐시 예열(측정 제외)
+        t0 = time.perf_counter()
+        idx = TokenIndex.build(texts, get_tokenizer(name))
+        sec = time.perf_counter() - t0
+        rows.append({"tokenizer": name, "docs": len(texts), "seconds": round(sec, 3),
+                     "docs_per_s": round(len(texts) / sec), "mb_per_s": round(size_mb / sec, 2),
+                     "tokens": len(idx.ids), "vocab": len(idx.vocab)})
+    return rows
+
+
+def main(argv=None):
+    from core import DATA_PATH, read_csv_safely, normalize_frame
+
+    ap = argparse.ArgumentParser(description="토크나이저 배치 처리량 벤치마크")
+    ap.add_argument("--csv", default=DATA_PATH)
+    ap.add_argument("--repeat", type=int, default=1, help="코퍼스를 N배로 늘려 측정")
+    args = ap.parse_args(argv)
+
+    df = normalize_frame(read_csv_safely(args.csv))
+    texts = (df["title"] + " " + df["desc"]).tolist() * args.repeat
+    rows = bench(texts)
+    base = next((r["seconds"] for r in rows if r["tokenizer"] == "en"), None)
+    for r in rows:
+        ratio = f" ({r['seconds'] / base:.2f}x en)" if base else ""
+        print(f"{r['tokenizer']:>7}: {r['docs']:,} docs · {r['seconds']}s · {r['docs_per_s']:,} docs/s · "
+              f"{r['mb_per_s']} MB/s · vocab {r['vocab']:,}{ratio}")
+
+
+if __name__ == "__main__":
+    main()
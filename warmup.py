@@ -0,0 +1,104 @@
+# ============================================================
+# 캐시 워밍업 — 배포/재시작 직후 첫 접속자가 기다리지 않도록
+# - 무거운 모듈 import + 데이터셋 디스크 캐시(정규화/보강/집계)를 미리 만든다
+# - 단계별 소요 시간을 출력
+#
+# 사용:
+#   python warmup.py                        # 디스크 캐시만 만들기(배포 스크립트/컨테이너 빌드 단계)
+#   python warmup.py --serve -- --server.port 8501
+#                                           # 같은 프로세스에서 데운 뒤 Streamlit 서버 시작
+# ============================================================
+
+import os
+import sys
+import glob
+import time
+import argparse
+import importlib
+
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+HEAVY_MODULES = ["pandas", "scipy.sparse", "plotly.express", "streamlit", "pyarrow"]
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.rows = []
+
+    def run(self, name: str, fn, *args, **kwargs):
+        t0 = time.perf_counter()
+        out = fn(*args, **kwargs)
+        self.rows.append((name, time.perf_counter() - t0))
+        return out
+
+    def report(self) -> str:
+        width = max(len(n) for n, _ in self.rows)
+        lines = [f"  {n.ljust(width)}  {sec * 1000:9.1f} ms" for n, sec in self.rows]
+        lines.append(f"  {'total'.ljust(width)}  {sum(s for _, s in self.rows) * 1000:9.1f} ms")
+        return "\n".join(lines)
+
+
+def prune_stale(path: str):
+    # 같은 원본(경로 + 토크나이저)에서 파일이 바뀌어 키가 달라진 옛 번들만 정리
+    # 다른 AI_AGENT_CSV_PATH/AI_AGENT_TOKENIZER 설정의 번들은 같은 폴더에 있어도 남겨 둔다
+    from core import CACHE_DIR, prepared_file, source_tag
+    keep = prepared_file(path)
+    for fp in glob.glob(os.path.join(CACHE_DIR, f"prepared-{source_tag(path)}-*.pkl")):
+        if os.path.abspath(fp) != os.path.abspath(keep):
+            try:
+                os.remove(fp)
+            except OSError:
+                pass
+
+
+def import_heavy(timer: PhaseTimer):
+    for name in HEAVY_MODULES:
+        timer.run(f"import {name}", importlib.import_module, name)
+
+
+def warm(path: str, timer: PhaseTimer, rebuild: bool = False):
+    from core import load_prepared, prepared_file
+    bundle = timer.run("build dataset cache" if rebuild else "load/build dataset cache",
+                       load_prepared, path, rebuild=rebuild)
+    timer.run("verify cache read", load_prepared, path)
+    prune_stale(path)
+
+    from snapshot import scan
+    added = timer.run("fingerprint new snapshots", scan, exclude=[path])
+    if added:
+        print(f"[warmup] snapshots added: {', '.join(added)}")
+    print(f"[warmup] {len(bundle['df']):,} rows · {prepared_file(path)}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    st_args = []
+    if "--" in argv:
+        i = argv.index("--")
+        argv, st_args = argv[:i], argv[i + 1:]
+
+    ap = argparse.ArgumentParser(description="데이터셋 캐시를 미리 만들고(선택) Streamlit 서버를 시작")
+    ap.add_argument("--csv", help="기본값: AI_AGENT_CSV_PATH 또는 core.DEFAULT_PATH")
+    ap.add_argument("--rebuild", action="store_true", help="디스크 캐시가 있어도 새로 만들기")
+    ap.add_argument("--serve", action="store_true", help="워밍업 후 같은 프로세스에서 서버 시작")
+    args = ap.parse_args(argv)
+    if args.csv:
+        # core import 전에 지정 → 서버에서 실행되는 main.py도 같은 경로를 본다
+        os.environ["AI_AGENT_CSV_PATH"] = args.csv
+    timer = PhaseTimer()
+    import_heavy(timer)   # core가 pandas를 올리기 전에 재야 단계별 시간이 정확하다
+    from core import DATA_PATH
+
+    warm(DATA_PATH, timer, rebuild=args.rebuild)
+    print("[warmup] startup phases")
+    print(timer.report())
+
+    if args.serve:
+        # 모듈/디스크 캐시가 올라간 이 프로세스에서 서버 시작 → 첫 접속이 CSV 파싱을 기다리지 않음
+        from streamlit.web import cli as stcli
+        sys.argv = ["streamlit", "run", APP_SCRIPT, *st_args]
+        sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()